@@ -1,43 +1,197 @@
-import pandas as pd
-from dash import Dash, dcc, html, Input, Output
+
+import numpy as np
+from dash import Dash, dcc, html, Input, Output, State, Patch, ALL
+from dash.exceptions import PreventUpdate
+from flask_caching import Cache
 import plotly.express as px
+import plotly.graph_objects as go
 
-# ------------------------------
-# Load dataset
-# ------------------------------
-df = pd.read_csv("bank_transactions.csv")
-df = df.dropna()
-
-df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-df["Year"] = df["Date"].dt.year
-df["Month"] = df["Date"].dt.month_name()
-df["Month_Num"] = df["Date"].dt.month
-
-month_order = (
-    df[["Month", "Month_Num"]]
-    .drop_duplicates()
-    .sort_values("Month_Num")["Month"]
-    .tolist()
-)
+from data import df, years, month_order
 
 # ------------------------------
 # App Setup
 # ------------------------------
 app = Dash(__name__)
 app.title = "Banking Transaction Analytics"
+server = app.server
 
-years = sorted(df["Year"].dropna().unique().astype(int))
+cache = Cache(
+    app.server,
+    config={
+        "CACHE_TYPE": "FileSystemCache",
+        "CACHE_DIR": ".cache",
+        "CACHE_DEFAULT_TIMEOUT": 3600,
+    },
+)
+# Memoize keys carry no code or data version, so never reuse a previous run's
+cache.clear()
 
 # ------------------------------
 # KPI CALCULATIONS
 # ------------------------------
+KPI_LABELS = ["Total Amount", "Total Credit", "Total Debit", "Net Balance"]
+
+
 def kpi_values(data):
-    total = data["Amount"].sum()
-    credit = data[data["Transaction_Type"] == "Credit"]["Amount"].sum()
-    debit = data[data["Transaction_Type"] == "Debit"]["Amount"].sum()
+    sums = data.groupby("Transaction_Type", observed=True)["Amount"].sum()
+    credit = sums.get("Credit", 0.0)
+    debit = sums.get("Debit", 0.0)
+    total = sums.sum()
     net = credit - debit
     return total, credit, debit, net
 
+# ------------------------------
+# Precomputed per-year tables
+# ------------------------------
+# Year-sorted index so each year cut is a searchsorted slice, not a mask
+df_by_year = df.set_index("Year").sort_index()
+
+# Per-year slices are views shared by every callback; treat them as read-only
+FRAMES = {"ALL": df_by_year}
+FRAMES.update({int(y): df_by_year.loc[y:y] for y in years})
+
+KPIS = {k: kpi_values(v) for k, v in FRAMES.items()}
+
+TYPES = [str(t) for t in df["Transaction_Type"].cat.categories]
+
+
+def month_totals(data):
+    # Month codes are 1..12, so a weighted bincount replaces the hash groupby
+    sums = np.bincount(
+        data["Month_Num"].to_numpy(),
+        weights=data["Amount"].to_numpy(np.float64),
+        minlength=13,
+    )
+    return sums[1:]
+
+def month_type_totals(data):
+    # Flatten (type code, month) into one key and reshape to a Type x Month grid
+    codes = data["Transaction_Type"].cat.codes.to_numpy().astype(np.intp)
+    sums = np.bincount(
+        codes * 13 + data["Month_Num"].to_numpy(),
+        weights=data["Amount"].to_numpy(np.float64),
+        minlength=13 * len(TYPES),
+    )
+    return sums.reshape(len(TYPES), 13)[:, 1:]
+
+MONTHLY = {k: month_totals(v) for k, v in FRAMES.items()}
+HEAT = {k: month_type_totals(v) for k, v in FRAMES.items()}
+
+# ------------------------------
+# Figures
+# ------------------------------
+def box_traces(data):
+    # Quartiles and Tukey fences computed server-side; only outliers ship as points
+    palette = px.colors.qualitative.Plotly
+    traces = []
+    grouped = data.groupby("Transaction_Type", observed=True)["Amount"]
+    for i, (name, amounts) in enumerate(grouped):
+        color = palette[i % len(palette)]
+        # Hazen quartiles match Plotly's default box quartilemethod="linear"
+        q1, median, q3 = (
+            float(q)
+            for q in np.quantile(amounts.to_numpy(), [0.25, 0.5, 0.75], method="hazen")
+        )
+        iqr = q3 - q1
+        inside = amounts.between(q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+        traces.append(
+            go.Box(
+                name=name,
+                x=[name],
+                q1=[q1],
+                median=[median],
+                q3=[q3],
+                lowerfence=[float(amounts[inside].min())],
+                upperfence=[float(amounts[inside].max())],
+                marker_color=color,
+                legendgroup=name,
+            )
+        )
+        outliers = amounts[~inside]
+        if len(outliers):
+            traces.append(
+                go.Scatter(
+                    name=name,
+                    x=[name] * len(outliers),
+                    y=outliers.tolist(),
+                    mode="markers",
+                    marker_color=color,
+                    legendgroup=name,
+                    showlegend=False,
+                )
+            )
+    return traces
+
+
+# Fixed layout per chart type, built once; callbacks clone and fill in data
+BASE = {
+    "donut": go.Figure(
+        go.Pie(hole=0.5),
+        layout=dict(title="Credit vs Debit Distribution"),
+    ),
+    "trend": go.Figure(
+        go.Scatter(mode="lines+markers"),
+        layout=dict(
+            title="Monthly Transaction Trend",
+            xaxis=dict(
+                title="Month",
+                categoryorder="array",
+                categoryarray=month_order,
+            ),
+            yaxis_title="Amount",
+        ),
+    ),
+    "box": go.Figure(
+        layout=dict(
+            title="Transaction Amount Distribution & Outliers",
+            xaxis_title="Transaction_Type",
+            yaxis_title="Amount",
+            legend_title_text="Transaction_Type",
+        ),
+    ),
+    "heatmap": go.Figure(
+        go.Heatmap(colorbar_title_text="sum of Amount"),
+        layout=dict(
+            title="Transaction Heatmap (Month vs Type)",
+            xaxis_title="Month",
+            yaxis_title="Transaction_Type",
+        ),
+    ),
+}
+for base in BASE.values():
+    base.update_layout(template="simple_white", title_x=0.5)
+
+
+def build_figure(selected_year, chart_type):
+    data = FRAMES[selected_year]
+
+    fig = go.Figure(BASE[chart_type])
+
+    if chart_type == "donut":
+        totals = data.groupby("Transaction_Type", observed=True)["Amount"].sum()
+        fig.data[0].update(
+            labels=totals.index.astype(str).tolist(),
+            values=totals.tolist(),
+        )
+
+    elif chart_type == "trend":
+        fig.data[0].update(x=month_order, y=MONTHLY[selected_year].tolist())
+
+    elif chart_type == "box":
+        fig.add_traces(box_traces(data))
+
+    else:
+        # Send the bucketed Type x Month grid rather than rows for Plotly to bin
+        fig.data[0].update(z=HEAT[selected_year], x=month_order, y=TYPES)
+
+    return fig
+
+
+@cache.memoize()
+def cached_figure(selected_year, chart_type):
+    # Cache the plain figure dict; a pickled go.Figure re-validates on load
+    return build_figure(selected_year, chart_type).to_plotly_json()
+
 # ------------------------------
 # Layout
 # ------------------------------
@@ -67,6 +221,22 @@ app.layout = html.Div(
                 "gap": "20px",
                 "marginTop": "30px",
             },
+            children=[
+                html.Div(
+                    style={
+                        "backgroundColor": "white",
+                        "padding": "20px",
+                        "borderRadius": "12px",
+                        "boxShadow": "0 4px 12px rgba(0,0,0,0.1)",
+                        "textAlign": "center",
+                    },
+                    children=[
+                        html.H4(label),
+                        html.H2(id={"type": "kpi", "label": label}),
+                    ],
+                )
+                for label in KPI_LABELS
+            ],
         ),
 
         # ---------------- Controls ----------------
@@ -83,6 +253,7 @@ app.layout = html.Div(
                     options=[{"label": "All Years", "value": "ALL"}]
                     + [{"label": str(y), "value": y} for y in years],
                     value="ALL",
+                    clearable=False,
                 ),
                 dcc.Dropdown(
                     id="chart-filter",
@@ -115,102 +286,48 @@ app.layout = html.Div(
 )
 
 # ------------------------------
-# Callback
+# Callbacks
 # ------------------------------
 @app.callback(
-    Output("kpi-cards", "children"),
+    Output({"type": "kpi", "label": ALL}, "children"),
+    Input("year-filter", "value"),
+)
+def update_kpis(selected_year):
+    # Cards are rendered once in the layout; only the four values change
+    return [f"₹ {value:,.0f}" for value in KPIS[selected_year]]
+
+@app.callback(
     Output("main-graph", "figure"),
     Input("year-filter", "value"),
     Input("chart-filter", "value"),
-    Input("animation-toggle", "value"),
+    State("animation-toggle", "value"),
 )
-def update_dashboard(selected_year, chart_type, animation_mode):
-    data = df.copy()
-    if selected_year != "ALL":
-        data = data[data["Year"] == selected_year]
-
-    total, credit, debit, net = kpi_values(data)
-
-    cards = [
-        html.Div(
-            style={
-                "backgroundColor": "white",
-                "padding": "20px",
-                "borderRadius": "12px",
-                "boxShadow": "0 4px 12px rgba(0,0,0,0.1)",
-                "textAlign": "center",
-            },
-            children=[html.H4(label), html.H2(value)],
-        )
-        for label, value in [
-            ("Total Amount", f"₹ {total:,.0f}"),
-            ("Total Credit", f"₹ {credit:,.0f}"),
-            ("Total Debit", f"₹ {debit:,.0f}"),
-            ("Net Balance", f"₹ {net:,.0f}"),
-        ]
-    ]
-
-    transition_time = 600 if animation_mode == "on" else 0
-
-    if chart_type == "donut":
-        fig = px.pie(
-            data,
-            names="Transaction_Type",
-            values="Amount",
-            hole=0.5,
-            title="Credit vs Debit Distribution",
-        )
-
-    elif chart_type == "trend":
-        monthly = (
-            data.groupby(["Month", "Month_Num"])["Amount"]
-            .sum()
-            .reset_index()
-            .sort_values("Month_Num")
-        )
-        fig = px.line(
-            monthly,
-            x="Month",
-            y="Amount",
-            markers=True,
-            category_orders={"Month": month_order},
-            title="Monthly Transaction Trend",
-        )
-
-    elif chart_type == "box":
-        fig = px.box(
-            data,
-            x="Transaction_Type",
-            y="Amount",
-            color="Transaction_Type",
-            title="Transaction Amount Distribution & Outliers",
-        )
+def update_graph(selected_year, chart_type, animation_mode):
+    # Normalise client input first so the memoize key space stays finite
+    if selected_year not in FRAMES:
+        raise PreventUpdate
+    if chart_type not in BASE:
+        chart_type = "heatmap"
+    fig = cached_figure(selected_year, chart_type)
+    # Animation is not part of the cache key; set the transition per response
+    fig["layout"]["transition"] = {"duration": 600 if animation_mode == "on" else 0}
+    return fig
 
-    else:
-        heat = (
-            data.groupby(["Month", "Transaction_Type"])["Amount"]
-            .sum()
-            .reset_index()
-        )
-        fig = px.density_heatmap(
-            heat,
-            x="Month",
-            y="Transaction_Type",
-            z="Amount",
-            category_orders={"Month": month_order},
-            title="Transaction Heatmap (Month vs Type)",
-        )
-
-    fig.update_layout(
-        template="simple_white",
-        title_x=0.5,
-        transition_duration=transition_time,
-    )
-
-    return cards, fig
+@app.callback(
+    Output("main-graph", "figure", allow_duplicate=True),
+    Input("animation-toggle", "value"),
+    prevent_initial_call=True,
+)
+def toggle_animation(animation_mode):
+    # Only the transition duration changes, so patch it in place on the client
+    patch = Patch()
+    patch["layout"]["transition"]["duration"] = 600 if animation_mode == "on" else 0
+    return patch
 
 # ------------------------------
 # Run App
 # ------------------------------
+# Production: gunicorn -w 4 --preload app:server
+# --preload loads the dataset once in the parent and shares it with workers
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run()
@@ -0,0 +1,53 @@
+import calendar
+import os
+from pathlib import Path
+
+import pandas as pd
+
+# ------------------------------
+# Load dataset
+# ------------------------------
+CSV_PATH = Path("bank_transactions.csv")
+PARQUET_PATH = Path("bank_transactions.parquet")
+
+
+def load():
+    # Reuse the cleaned Parquet copy unless the CSV or this loader is newer
+    if PARQUET_PATH.exists() and PARQUET_PATH.stat().st_mtime >= max(
+        CSV_PATH.stat().st_mtime, Path(__file__).stat().st_mtime
+    ):
+        return pd.read_parquet(PARQUET_PATH)
+
+    d = pd.read_csv(CSV_PATH)
+    d = d.dropna()
+    d["Transaction_Type"] = d["Transaction_Type"].astype("category")
+    d["Amount"] = pd.to_numeric(d["Amount"], downcast="float")
+
+    d["Date"] = pd.to_datetime(
+        d["Date"], format="%Y-%m-%d %H:%M:%S", errors="coerce"
+    )
+    d = d.dropna(subset=["Date"])
+    d["Year"] = d["Date"].dt.year.astype("int16")
+    d["Month_Num"] = d["Date"].dt.month.astype("int8")
+
+    # Best-effort cache: write a temp file and swap it in so readers never see
+    # a partial file, and keep serving from the CSV if the write fails
+    tmp_path = PARQUET_PATH.with_name(f"{PARQUET_PATH.name}.{os.getpid()}.tmp")
+    try:
+        d.to_parquet(tmp_path)
+        os.replace(tmp_path, PARQUET_PATH)
+    except (OSError, ImportError):
+        tmp_path.unlink(missing_ok=True)
+    return d
+
+
+df = load()
+
+
+def get_df():
+    return df
+
+
+years = sorted(df["Year"].unique().astype(int))
+
+month_order = [calendar.month_name[i] for i in range(1, 13)]